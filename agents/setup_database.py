@@ -3,178 +3,216 @@ Initialize SQLite database with chargeback management schema.
 Run this script to create a clean database with all tables and indexes.
 """
 
+import os
 import sqlite3
 from pathlib import Path
 from datetime import datetime
 
-# Database path - in agents directory
+# Database path - in agents directory unless CHARGEBACK_DB overrides it
 DB_DIR = Path(__file__).parent
-DB_PATH = DB_DIR / "chargeback_system.db"
+DB_PATH = Path(os.environ.get("CHARGEBACK_DB") or DB_DIR / "chargeback_system.db")
+IN_MEMORY = str(DB_PATH) == ":memory:"
+
+# Secondary indexes as (name, table, column). Kept separate from the table DDL
+# so bulk loads can create them once after the data is in place.
+INDEXES = [
+    # Covers customer -> transaction_id joins without reading the table rows
+    ("idx_transactions_customer", "transactions", "customer_id, transaction_id"),
+    ("idx_transactions_merchant", "transactions", "merchant_id"),
+    ("idx_transactions_date", "transactions", "transaction_date"),
+    ("idx_transactions_risk_level", "transactions", "risk_level"),
+    ("idx_transactions_status", "transactions", "status"),
+    ("idx_chargebacks_transaction", "chargebacks", "transaction_id"),
+    ("idx_chargebacks_status", "chargebacks", "status"),
+    ("idx_chargebacks_opened", "chargebacks", "opened_at"),
+    ("idx_chargebacks_outcome", "chargebacks", "outcome"),
+    ("idx_case_events_chargeback", "case_events", "chargeback_id"),
+    ("idx_case_events_type", "case_events", "event_type"),
+    ("idx_case_events_date", "case_events", "event_date"),
+]
+
+
+# Tables created by TABLES_SQL, in creation order
+TABLES = ("customers", "merchants", "transactions", "chargebacks", "case_events")
+
+# Table DDL, run as one script so the whole schema is parsed in a single call
+TABLES_SQL = """
+    -- 1. CUSTOMERS TABLE
+    CREATE TABLE customers (
+        customer_id VARCHAR(50) PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        email VARCHAR(255),
+        region VARCHAR(100),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        total_chargebacks INTEGER DEFAULT 0,
+        total_refunds DECIMAL(10,2) DEFAULT 0.00
+    );
+
+    -- 2. MERCHANTS TABLE
+    CREATE TABLE merchants (
+        merchant_id VARCHAR(50) PRIMARY KEY,
+        merchant_name VARCHAR(255) NOT NULL,
+        acquiring_bank VARCHAR(100),
+        win_rate DECIMAL(5,2),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- 3. TRANSACTIONS TABLE (with embedded risk data)
+    CREATE TABLE transactions (
+        transaction_id VARCHAR(50) PRIMARY KEY,
+        customer_id VARCHAR(50) NOT NULL,
+        merchant_id VARCHAR(50) NOT NULL,
+
+        -- Transaction basics
+        amount DECIMAL(10,2) NOT NULL,
+        currency VARCHAR(3) DEFAULT 'USD',
+        payment_method VARCHAR(50),
+        card_last_4 VARCHAR(4),
+        transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        status VARCHAR(20) DEFAULT 'completed',
+
+        -- Gateway verification data
+        avs_check VARCHAR(10),
+        cvv_check VARCHAR(10),
+        three_ds_used BOOLEAN DEFAULT 0,
+        auth_code VARCHAR(20),
+
+        -- Device/session data
+        ip_address VARCHAR(45),
+        device_fingerprint VARCHAR(255),
+
+        -- Risk assessment data
+        fraud_score DECIMAL(5,2),
+        risk_level VARCHAR(20),
+        velocity_flag BOOLEAN DEFAULT 0,
+        cards_last_24h INTEGER,
+        same_ip_count INTEGER,
+        transactions_last_week INTEGER,
+        risk_assessed_at TIMESTAMP,
+
+        FOREIGN KEY (customer_id) REFERENCES customers(customer_id),
+        FOREIGN KEY (merchant_id) REFERENCES merchants(merchant_id)
+    );
+
+    -- 4. CHARGEBACKS TABLE
+    CREATE TABLE chargebacks (
+        chargeback_id VARCHAR(50) PRIMARY KEY,
+        transaction_id VARCHAR(50) NOT NULL,
+
+        -- Dispute details
+        dispute_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        reason_code VARCHAR(10),
+        dispute_type VARCHAR(50),
+        issuing_bank VARCHAR(100),
+        chargeback_amount DECIMAL(10,2) NOT NULL,
+
+        -- Case management
+        analyst_id VARCHAR(50),
+        status VARCHAR(20) DEFAULT 'open',
+        opened_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        closed_at TIMESTAMP,
+        outcome VARCHAR(20),
+
+        -- Reference data
+        retrieval_request_date TIMESTAMP,
+        response_deadline TIMESTAMP,
+        notes TEXT,
+
+        FOREIGN KEY (transaction_id) REFERENCES transactions(transaction_id)
+    );
+
+    -- 5. CASE_EVENTS TABLE (Activity log)
+    CREATE TABLE case_events (
+        event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        chargeback_id VARCHAR(50) NOT NULL,
+        event_type VARCHAR(50) NOT NULL,
+        event_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        event_data TEXT,
+        description TEXT,
+
+        FOREIGN KEY (chargeback_id) REFERENCES chargebacks(chargeback_id)
+    );
+"""
 
 
-def init_database():
-    """Create database and all tables with proper schema."""
+def _index_ddl():
+    """CREATE INDEX statements for the indexes in INDEXES."""
+    return [f"CREATE INDEX {idx_name} ON {table}({column})"
+            for idx_name, table, column in INDEXES]
 
-    # Remove existing database for clean setup
-    if DB_PATH.exists():
-        print(f"🗑️  Removing existing database: {DB_PATH}")
-        DB_PATH.unlink()
 
-    # Connect to SQLite database (creates new file)
-    conn = sqlite3.connect(str(DB_PATH))
-    cursor = conn.cursor()
+def _create_tables(cursor, extra_ddl=()):
+    """Create all tables, followed by extra_ddl, as one script and transaction."""
+    # executescript commits any open transaction before running, so the
+    # BEGIN is part of the script itself
+    script = TABLES_SQL + "".join(f"{statement};\n" for statement in extra_ddl)
+    cursor.executescript(f"BEGIN IMMEDIATE;\n{script}COMMIT;")
+    for table in TABLES:
+        print(f"   Created {table} table")
 
-    print(f"\n📦 Creating fresh database at: {DB_PATH}")
 
-    # Enable foreign keys
-    cursor.execute("PRAGMA foreign_keys = ON")
-
-    # 1. CUSTOMERS TABLE
-    print("   Creating customers table...")
-    cursor.execute("""
-        CREATE TABLE customers (
-            customer_id VARCHAR(50) PRIMARY KEY,
-            name VARCHAR(255) NOT NULL,
-            email VARCHAR(255),
-            region VARCHAR(100),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            total_chargebacks INTEGER DEFAULT 0,
-            total_refunds DECIMAL(10,2) DEFAULT 0.00
-        )
-    """)
+def create_tables(cursor):
+    """Create all tables, without their secondary indexes, on an empty database."""
+    _create_tables(cursor)
 
-    # 2. MERCHANTS TABLE
-    print("   Creating merchants table...")
-    cursor.execute("""
-        CREATE TABLE merchants (
-            merchant_id VARCHAR(50) PRIMARY KEY,
-            merchant_name VARCHAR(255) NOT NULL,
-            acquiring_bank VARCHAR(100),
-            win_rate DECIMAL(5,2),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
 
-    # 3. TRANSACTIONS TABLE (with embedded risk data)
-    print("   Creating transactions table...")
-    cursor.execute("""
-        CREATE TABLE transactions (
-            transaction_id VARCHAR(50) PRIMARY KEY,
-            customer_id VARCHAR(50) NOT NULL,
-            merchant_id VARCHAR(50) NOT NULL,
-
-            -- Transaction basics
-            amount DECIMAL(10,2) NOT NULL,
-            currency VARCHAR(3) DEFAULT 'USD',
-            payment_method VARCHAR(50),
-            card_last_4 VARCHAR(4),
-            transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            status VARCHAR(20) DEFAULT 'completed',
-
-            -- Gateway verification data
-            avs_check VARCHAR(10),
-            cvv_check VARCHAR(10),
-            three_ds_used BOOLEAN DEFAULT 0,
-            auth_code VARCHAR(20),
-
-            -- Device/session data
-            ip_address VARCHAR(45),
-            device_fingerprint VARCHAR(255),
-
-            -- Risk assessment data
-            fraud_score DECIMAL(5,2),
-            risk_level VARCHAR(20),
-            velocity_flag BOOLEAN DEFAULT 0,
-            velocity_data TEXT,
-            risk_assessed_at TIMESTAMP,
-
-            FOREIGN KEY (customer_id) REFERENCES customers(customer_id),
-            FOREIGN KEY (merchant_id) REFERENCES merchants(merchant_id)
-        )
-    """)
+def create_indexes(cursor):
+    """Create the secondary indexes in INDEXES."""
+    for statement in _index_ddl():
+        cursor.execute(statement)
 
-    # 4. CHARGEBACKS TABLE
-    print("   Creating chargebacks table...")
-    cursor.execute("""
-        CREATE TABLE chargebacks (
-            chargeback_id VARCHAR(50) PRIMARY KEY,
-            transaction_id VARCHAR(50) NOT NULL,
-
-            -- Dispute details
-            dispute_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            reason_code VARCHAR(10),
-            dispute_type VARCHAR(50),
-            issuing_bank VARCHAR(100),
-            chargeback_amount DECIMAL(10,2) NOT NULL,
-
-            -- Case management
-            analyst_id VARCHAR(50),
-            status VARCHAR(20) DEFAULT 'open',
-            opened_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            closed_at TIMESTAMP,
-            outcome VARCHAR(20),
-
-            -- Reference data
-            retrieval_request_date TIMESTAMP,
-            response_deadline TIMESTAMP,
-            notes TEXT,
-
-            FOREIGN KEY (transaction_id) REFERENCES transactions(transaction_id)
-        )
-    """)
 
-    # 5. CASE_EVENTS TABLE (Activity log)
-    print("   Creating case_events table...")
-    cursor.execute("""
-        CREATE TABLE case_events (
-            event_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            chargeback_id VARCHAR(50) NOT NULL,
-            event_type VARCHAR(50) NOT NULL,
-            event_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            event_data TEXT,
-            description TEXT,
-
-            FOREIGN KEY (chargeback_id) REFERENCES chargebacks(chargeback_id)
-        )
-    """)
+def create_schema(cursor):
+    """Create all tables and their indexes on an empty database in one script."""
+    _create_tables(cursor, _index_ddl())
 
-    # Create performance indexes
-    print("\n📊 Creating indexes for query optimization...")
-
-    indexes = [
-        ("idx_transactions_customer", "transactions", "customer_id"),
-        ("idx_transactions_merchant", "transactions", "merchant_id"),
-        ("idx_transactions_date", "transactions", "transaction_date"),
-        ("idx_transactions_risk_level", "transactions", "risk_level"),
-        ("idx_transactions_status", "transactions", "status"),
-        ("idx_chargebacks_transaction", "chargebacks", "transaction_id"),
-        ("idx_chargebacks_status", "chargebacks", "status"),
-        ("idx_chargebacks_opened", "chargebacks", "opened_at"),
-        ("idx_chargebacks_outcome", "chargebacks", "outcome"),
-        ("idx_case_events_chargeback", "case_events", "chargeback_id"),
-        ("idx_case_events_type", "case_events", "event_type"),
-        ("idx_case_events_date", "case_events", "event_date"),
-    ]
-
-    for idx_name, table, column in indexes:
-        cursor.execute(f"""
-            CREATE INDEX {idx_name} ON {table}({column})
-        """)
+    print("\n📊 Created indexes for query optimization:")
+    for idx_name, _, _ in INDEXES:
         print(f"   ✓ {idx_name}")
 
-    # Commit all changes
-    conn.commit()
+
+def init_database():
+    """Create database and all tables with proper schema."""
+
+    # Remove existing database for clean setup
+    if not IN_MEMORY:
+        if DB_PATH.exists():
+            print(f"🗑️  Removing existing database: {DB_PATH}")
+            DB_PATH.unlink()
+        # The database runs in WAL mode. A leftover -wal/-shm pair from the old file
+        # would otherwise be picked up by the new one.
+        for suffix in ("-wal", "-shm"):
+            DB_PATH.with_name(DB_PATH.name + suffix).unlink(missing_ok=True)
+
+    # Connect to SQLite database (creates new file). Autocommit mode so the
+    # schema is created in the single explicit transaction of create_schema.
+    conn = sqlite3.connect(str(DB_PATH), isolation_level=None)
+    cursor = conn.cursor()
+
+    print(f"\n📦 Creating fresh database at: {DB_PATH}")
+
+    # Enable foreign keys. WAL is persistent, so the file is created in the
+    # journal mode the seed runs in.
+    cursor.executescript("""
+        PRAGMA foreign_keys = ON;
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+    """)
+
+    create_schema(cursor)
 
     # Verify database structure
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-    tables = cursor.fetchall()
+    tables = [name for name, in cursor.fetchall()]
 
     print(f"\n✅ Database initialized successfully!")
     print(f"\n📋 Created {len(tables)} tables:")
-    for table in tables:
-        cursor.execute(f"SELECT COUNT(*) FROM {table[0]}")
-        count = cursor.fetchone()[0]
-        print(f"   • {table[0]:<20} ({count} rows)")
+    # Row counts for every table in a single query
+    cursor.execute(" UNION ALL ".join(
+        f"SELECT '{table}', COUNT(*) FROM {table}" for table in tables
+    ))
+    for table, count in cursor:
+        print(f"   • {table:<20} ({count} rows)")
 
     # Show database info
     cursor.execute("PRAGMA database_list")
@@ -182,8 +220,10 @@ def init_database():
 
     conn.close()
 
-    print(f"\n💾 Database location: {DB_PATH.absolute()}")
-    print(f"📏 Database size: {DB_PATH.stat().st_size:,} bytes")
+    # An in-memory database has no file to report on
+    if not IN_MEMORY:
+        print(f"\n💾 Database location: {DB_PATH.absolute()}")
+        print(f"📏 Database size: {DB_PATH.stat().st_size:,} bytes")
     print("\n🚀 Database is ready to use!")
     print("\nYou can now:")
     print("  • Import data into the tables")
@@ -3,14 +3,55 @@ View data from the chargeback system database.
 Shows all tables with formatted output.
 """
 
+import os
 import sqlite3
 from pathlib import Path
-from tabulate import tabulate
 import json
 
-# Database path
+# Database path - in agents directory unless CHARGEBACK_DB overrides it
 DB_DIR = Path(__file__).parent
-DB_PATH = DB_DIR / "chargeback_system.db"
+DB_PATH = Path(os.environ.get("CHARGEBACK_DB") or DB_DIR / "chargeback_system.db")
+
+
+def print_query(cursor, headers):
+    """Print the remaining rows of cursor as a grid table.
+
+    Cells are converted to text in a single pass that also measures the
+    column widths. Numbers are right-aligned, floats rounded to two decimal
+    places, and NULLs print as empty cells.
+    Returns False, printing nothing, if the query returned no rows.
+    """
+    widths = [len(header) for header in headers]
+    numeric = [True] * len(headers)
+    rows = []
+    for row in cursor:
+        cells = []
+        for i, value in enumerate(row):
+            if value is None:
+                text = ""
+            elif isinstance(value, float):
+                text = str(round(value, 2))
+            else:
+                text = str(value)
+            if value is not None and not isinstance(value, (int, float)):
+                numeric[i] = False
+            widths[i] = max(widths[i], len(text))
+            cells.append(text)
+        rows.append(cells)
+    if not rows:
+        return False
+
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    print(separator)
+    print("| " + " | ".join(header.ljust(width) for header, width in zip(headers, widths)) + " |")
+    print(separator.replace("-", "="))
+    for cells in rows:
+        print("| " + " | ".join(
+            text.rjust(width) if is_numeric else text.ljust(width)
+            for text, width, is_numeric in zip(cells, widths, numeric)
+        ) + " |")
+        print(separator)
+    return True
 
 
 def view_database():
@@ -33,12 +74,13 @@ def view_database():
     print(f"   Location: {DB_PATH.absolute()}")
     print(f"   Size: {DB_PATH.stat().st_size:,} bytes")
     
-    # Get table counts
+    # Get table counts in a single query
     tables = ['customers', 'merchants', 'transactions', 'chargebacks', 'case_events']
     print("\n   Table Counts:")
-    for table in tables:
-        cursor.execute(f"SELECT COUNT(*) FROM {table}")
-        count = cursor.fetchone()[0]
+    cursor.execute(
+        "SELECT " + ", ".join(f"(SELECT COUNT(*) FROM {table})" for table in tables)
+    )
+    for table, count in zip(tables, cursor.fetchone()):
         print(f"      • {table:<20} {count:>4} rows")
     
     # 2. Customers
@@ -51,11 +93,8 @@ def view_database():
         FROM customers
         ORDER BY customer_id
     """)
-    customers = cursor.fetchall()
-    if customers:
-        headers = ["ID", "Name", "Email", "Region", "Total CBs", "Created"]
-        print(tabulate(customers, headers=headers, tablefmt="grid"))
-    else:
+    headers = ["ID", "Name", "Email", "Region", "Total CBs", "Created"]
+    if not print_query(cursor, headers):
         print("   No customers found.")
     
     # 3. Merchants
@@ -67,11 +106,8 @@ def view_database():
         FROM merchants
         ORDER BY merchant_id
     """)
-    merchants = cursor.fetchall()
-    if merchants:
-        headers = ["ID", "Name", "Acquiring Bank", "Win Rate %", "Created"]
-        print(tabulate(merchants, headers=headers, tablefmt="grid"))
-    else:
+    headers = ["ID", "Name", "Acquiring Bank", "Win Rate %", "Created"]
+    if not print_query(cursor, headers):
         print("   No merchants found.")
     
     # 4. Transactions Summary
@@ -116,11 +152,9 @@ def view_database():
         ORDER BY t.transaction_date DESC
         LIMIT 10
     """)
-    transactions = cursor.fetchall()
-    if transactions:
-        headers = ["Transaction ID", "Customer", "Merchant", "Amount", "Currency", 
-                  "Payment Method", "Date", "Status", "Risk Level", "Fraud Score"]
-        print(tabulate(transactions, headers=headers, tablefmt="grid"))
+    headers = ["Transaction ID", "Customer", "Merchant", "Amount", "Currency", 
+              "Payment Method", "Date", "Status", "Risk Level", "Fraud Score"]
+    print_query(cursor, headers)
     
     # 5. Chargebacks
     print("\n" + "=" * 80)
@@ -168,13 +202,10 @@ def view_database():
         JOIN merchants m ON t.merchant_id = m.merchant_id
         ORDER BY c.dispute_date DESC
     """)
-    chargebacks = cursor.fetchall()
-    if chargebacks:
-        headers = ["Chargeback ID", "Transaction ID", "Dispute Date", "Reason Code", 
-                  "Type", "CB Amount", "Status", "Outcome", "Issuing Bank", 
-                  "Tx Amount", "Customer", "Merchant"]
-        print(tabulate(chargebacks, headers=headers, tablefmt="grid"))
-    else:
+    headers = ["Chargeback ID", "Transaction ID", "Dispute Date", "Reason Code", 
+              "Type", "CB Amount", "Status", "Outcome", "Issuing Bank", 
+              "Tx Amount", "Customer", "Merchant"]
+    if not print_query(cursor, headers):
         print("   No chargebacks found.")
     
     # 6. Case Events Summary
@@ -189,10 +220,7 @@ def view_database():
         GROUP BY event_type
         ORDER BY count DESC
     """)
-    events = cursor.fetchall()
-    if events:
-        headers = ["Event Type", "Count"]
-        print(tabulate(events, headers=headers, tablefmt="grid"))
+    if print_query(cursor, ["Event Type", "Count"]):
         
         # Show sample events
         print("\n   Sample Events (last 10):")
@@ -207,10 +235,7 @@ def view_database():
             ORDER BY ce.event_date DESC
             LIMIT 10
         """)
-        sample_events = cursor.fetchall()
-        if sample_events:
-            headers = ["Event ID", "Chargeback ID", "Type", "Date", "Description"]
-            print(tabulate(sample_events, headers=headers, tablefmt="grid"))
+        print_query(cursor, ["Event ID", "Chargeback ID", "Type", "Date", "Description"])
     else:
         print("   No case events found.")
     
@@ -229,10 +254,7 @@ def view_database():
         GROUP BY risk_level
         ORDER BY avg_fraud_score DESC
     """)
-    risk_stats = cursor.fetchall()
-    if risk_stats:
-        headers = ["Risk Level", "Count", "Avg Fraud Score", "Total Amount"]
-        print(tabulate(risk_stats, headers=headers, tablefmt="grid"))
+    print_query(cursor, ["Risk Level", "Count", "Avg Fraud Score", "Total Amount"])
     
     print("\n" + "=" * 80)
     print("✅ Database view complete!")